@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+DSPy Director Bake-Off: Compiling (Optimizing) the Program
+
+So far every LLM call in director_bake_off.py is "zero-shot": the model
+only sees the signature's instructions. DSPy can do better than that by
+*compiling* the program - an optimizer runs it on example inputs, scores
+the results with a metric, and rewrites the instructions and few-shot
+demos for each predictor until the score improves.
+
+A well-compiled program often lets a smaller, faster model match the
+quality of a bigger one. MIPROv2 needs the optional optuna package, so
+install DSPy's extra first, then try it:
+
+    pip install "dspy[optuna]"
+    DSPY_MODEL=openrouter/google/gemini-flash-1.5 python compile_bake_off.py
+
+The result is saved to bake_off_compiled.json, which run_bake_off()
+loads automatically (keep the same DSPY_MODEL when you run the app).
+
+Key DSPy Concepts Demonstrated:
+1. Examples - Training data as dspy.Example objects
+2. Metrics - Plain Python functions that score a prediction
+3. Optimizers - MIPROv2 tunes instructions and demos automatically
+4. Save/Load - Persist the compiled program as JSON
+
+Author: DSPy Learning Example
+"""
+
+# Third-party imports
+import dspy
+
+# Our DSPy program
+from director_bake_off import (
+    COMPILED_PROGRAM_PATH,
+    DirectorBakeOff,
+    setup_dspy_provider,
+)
+
+
+# ==========================================================================
+# SECTION 1: TRAINING DATA
+# ==========================================================================
+
+"""
+🧪 WHAT IS A TRAINSET?
+
+Each dspy.Example holds the inputs we pass to the program plus the
+"gold" answer we'd like it to produce. Here the gold answer is how a
+human would rank the user's directors for that video idea (1 is best).
+
+.with_inputs(...) tells DSPy which fields are inputs; the rest are labels.
+
+These few examples are just a starting point: 20-50 human-rated
+examples give the optimizer much more to work with.
+"""
+
+TRAINING_DATA = [
+    ("A tense standoff between two strangers in a roadside diner.",
+     ["Quentin Tarantino", "Richard Curtis", "Alfred Hitchcock"], [1, 3, 2]),
+    ("A shy couple's first kiss at a snowy London bus stop.",
+     ["Richard Curtis", "Quentin Tarantino", "Alfred Hitchcock"], [1, 3, 2]),
+    ("A woman slowly realises someone is watching her from the apartment opposite.",
+     ["Alfred Hitchcock", "Richard Curtis", "Quentin Tarantino"], [1, 3, 2]),
+    ("A lone astronaut repairing a satellite as the sun rises over Earth.",
+     ["Christopher Nolan", "Wes Anderson", "Richard Curtis"], [1, 2, 3]),
+    ("A perfectly symmetrical hotel lobby full of eccentric staff.",
+     ["Wes Anderson", "Quentin Tarantino", "Alfred Hitchcock"], [1, 3, 2]),
+    ("A samurai duel in a bamboo forest during a rainstorm.",
+     ["Akira Kurosawa", "Richard Curtis", "Quentin Tarantino"], [1, 3, 2]),
+    ("A family reunion at Christmas where everyone is secretly miserable.",
+     ["Richard Curtis", "Wes Anderson", "Christopher Nolan"], [1, 2, 3]),
+    ("A heist crew arguing in a warehouse after the job goes wrong.",
+     ["Quentin Tarantino", "Wes Anderson", "Richard Curtis"], [1, 2, 3]),
+]
+
+trainset = [
+    dspy.Example(
+        video_idea=video_idea,
+        directors=directors,
+        expected_ranking=expected_ranking,
+    ).with_inputs("video_idea", "directors")
+    for video_idea, directors, expected_ranking in TRAINING_DATA
+]
+
+
+# ==========================================================================
+# SECTION 2: THE METRIC
+# ==========================================================================
+
+def ranking_agreement(example, prediction, trace=None) -> float:
+    """
+    📏 METRIC: How well does the judge agree with the human ranking?
+
+    The program also ranks its own AI-suggested director, which has no
+    gold rank, so we only compare the user's directors. For every pair
+    of them we check whether the judge put them in the same order as
+    the human did, and return the fraction of pairs it got right.
+
+    While the optimizer is bootstrapping few-shot demos it passes a trace,
+    and then we answer a yes/no question instead: only a perfect ranking
+    is good enough to become a demo.
+
+    Returns:
+        float: 1.0 for a perfect match, 0.0 for a fully reversed ranking
+        (a bool while bootstrapping, when trace is set)
+    """
+    gold = example.expected_ranking
+    predicted = prediction.director_ranks.director_rankings[:len(gold)]
+    if len(predicted) < len(gold):
+        return 0.0
+
+    pairs = [(i, j) for i in range(len(gold)) for j in range(i + 1, len(gold))]
+    agreed = sum(
+        (gold[i] < gold[j]) == (predicted[i] < predicted[j])
+        for i, j in pairs
+    )
+    score = agreed / len(pairs)
+    if trace is not None:
+        return score == 1.0
+    return score
+
+
+# ==========================================================================
+# SECTION 3: COMPILE AND SAVE
+# ==========================================================================
+
+if __name__ == "__main__":
+    """
+    🛠️ Run the optimizer and save the compiled program.
+
+    Try running: python compile_bake_off.py
+    """
+    print("🛠️ Compiling the Director Bake-Off")
+    print("=" * 40)
+
+    provider = setup_dspy_provider()
+    print(f"   ✅ DSPy configured with {provider} provider.")
+
+    # MIPROv2 proposes new instructions and picks few-shot demos for every
+    # predictor, keeping whichever combination scores best on the metric.
+    # auto="light" keeps the number of trials (and API calls) small.
+    optimizer = dspy.MIPROv2(metric=ranking_agreement, auto="light")
+
+    # use_cache=False: the optimizer has to watch each predictor really run
+    compiled = optimizer.compile(DirectorBakeOff(use_cache=False), trainset=trainset)
+
+    compiled.save(COMPILED_PROGRAM_PATH)
+    print(f"\n🎉 Saved compiled program to {COMPILED_PROGRAM_PATH}")
+    print("   run_bake_off() will load it automatically from now on.")
@@ -18,13 +18,18 @@ Author: DSPy Learning Example
 # Standard library imports
 import os
 import sys
+import sqlite3
 import asyncio
-from typing import List
+import hashlib
+import threading
+from contextlib import closing
+from typing import ClassVar, List, Optional, Sequence, Tuple, Union
 
 # Third-party imports
 import dspy                    # The main DSPy framework for LLM programming
+import litellm                 # DSPy's LLM client (installed with dspy); for its error types
 from dotenv import load_dotenv # For loading environment variables from .env file
-from pydantic import BaseModel, Field  # For structured data validation
+from pydantic import BaseModel, Field, PrivateAttr  # For structured data validation
 
 # Load environment variables from .env file (contains API keys)
 load_dotenv()
@@ -33,6 +38,52 @@ load_dotenv()
 # This will be set up once and reused throughout the application
 lm = None
 
+# The directors we compare when the user doesn't name any
+DEFAULT_DIRECTORS = ("Quentin Tarantino", "Alfred Hitchcock", "Richard Curtis")
+
+# Which model to use, in DSPy's "provider/model_name" format
+# Set DSPY_MODEL in your .env to try another one (e.g. a smaller, faster
+# model paired with a compiled program - see compile_bake_off.py)
+DSPY_MODEL = os.getenv('DSPY_MODEL', 'openrouter/moonshotai/kimi-k2:free')
+
+# Where compile_bake_off.py saves the optimized program
+# If this file exists, run_bake_off loads it automatically
+COMPILED_PROGRAM_PATH = os.getenv('COMPILED_PROGRAM_PATH', 'bake_off_compiled.json')
+
+# Where generated director cuts are cached between runs (a small SQLite file)
+# Override with DIRECTOR_CUT_CACHE_PATH in your .env if you want it elsewhere
+DIRECTOR_CUT_CACHE_PATH = os.getenv('DIRECTOR_CUT_CACHE_PATH', '.dspy_cache.sqlite')
+
+# Where DSPy keeps its on-disk cache of raw LLM responses
+LM_CACHE_DIR = os.getenv('LM_CACHE_DIR', '.dspy_lm_cache')
+
+# Output token limits: decode time grows with every token the LLM writes,
+# so we cap it. LM_MAX_TOKENS is the default for every call; a single
+# director cut needs far less, while the chain-of-thought judge writes its
+# reasoning, the rankings and an HTML explanation, so it gets more.
+LM_MAX_TOKENS = 1500
+DIRECTOR_CUT_MAX_TOKENS = 600
+JUDGE_MAX_TOKENS = 3000
+
+# How long one director cut may take before we give up and retry
+# (a batched call writing N cuts gets N times as long), and how many
+# tries it gets (free-tier models can stall for 30s+)
+DIRECTOR_CUT_TIMEOUT = 30
+DIRECTOR_CUT_ATTEMPTS = 3
+
+# Errors worth another try: the call timed out or the provider was busy or
+# unreachable. Anything else (like a reply DSPy can't parse) would fail the
+# same way again - the LM cache at temperature 0 just replays it
+RETRYABLE_ERRORS = (
+    asyncio.TimeoutError,
+    ConnectionError,
+    litellm.Timeout,
+    litellm.APIConnectionError,
+    litellm.RateLimitError,
+    litellm.ServiceUnavailableError,
+    litellm.InternalServerError,
+)
+
 
 # ==========================================================================
 # SECTION 1: LLM SETUP AND CONFIGURATION
@@ -57,10 +108,24 @@ def setup_dspy_provider():
         
         # Create a DSPy Language Model object
         # Format: "provider/model_name"
-        # Here we use a free model from Moonshot AI via OpenRouter
+        # By default we use a free model from Moonshot AI via OpenRouter
+        # cache=True means an identical request is answered from DSPy's
+        # cache instead of calling the API again. temperature=0 makes the
+        # answers deterministic, so identical requests really are identical.
         lm = dspy.LM(
-            model="openrouter/moonshotai/kimi-k2:free", 
-            api_key=os.getenv('OPENROUTER_API_KEY')
+            model=DSPY_MODEL, 
+            api_key=os.getenv('OPENROUTER_API_KEY'),
+            temperature=0,
+            max_tokens=LM_MAX_TOKENS,
+            cache=True
+        )
+        
+        # Keep that cache on disk in the project folder, so it survives
+        # restarts (handy when re-running the same ideas while experimenting)
+        dspy.configure_cache(
+            enable_disk_cache=True,
+            enable_memory_cache=True,
+            disk_cache_dir=LM_CACHE_DIR
         )
         
         # Configure DSPy to use this language model globally
@@ -133,6 +198,36 @@ class DirectorCut(BaseModel):
         ..., 
         description="The lighting style and color palette that sets the mood."
     )
+    
+    # Names of the seven cinematic fields above, in prompt order
+    # (ClassVar tells Pydantic this is a constant, not another field)
+    CINEMATIC_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "subject_description",
+        "action_description",
+        "setting_description",
+        "cinematic_style",
+        "shot_and_framing",
+        "camera_movement",
+        "lighting_and_color",
+    )
+
+    # The assembled prompt, remembered after the first assemble_prompt() call
+    # (private attributes start with _ and are never sent to or from the LLM)
+    _assembled_prompt: Optional[str] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_prediction(cls, video_idea: str, director: str, prediction) -> "DirectorCut":
+        """
+        Builds a DirectorCut from a GenerateDirectorCut prediction.
+        
+        The LLM only writes the seven cinematic fields; the director and
+        video idea are filled in here from what we asked for.
+        """
+        return cls(
+            director=director,
+            video_idea=video_idea,
+            **{name: getattr(prediction, name) for name in cls.CINEMATIC_FIELDS}
+        )
 
     def assemble_prompt(self) -> str:
         """
@@ -141,30 +236,48 @@ class DirectorCut(BaseModel):
         This method takes all the individual pieces and creates a complete
         prompt that could be used with video generation AI models.
         
+        The result is cached on the object, so printing, judging and
+        rendering the same cut only builds the prompt once.
+        
         Returns:
             str: A complete, formatted cinematic prompt
         """
-        # Collect all the cinematic components (excluding director and video_idea)
-        components = [
-            self.subject_description,
-            self.action_description,
-            self.setting_description,
-            self.cinematic_style,
-            self.shot_and_framing,
-            self.camera_movement,
-            self.lighting_and_color,
+        if self._assembled_prompt is None:
+            self._assembled_prompt = self._build_prompt()
+        return self._assembled_prompt
+
+    def _build_prompt(self) -> str:
+        """Joins the cinematic components into one prompt (see assemble_prompt)."""
+        # Collect all the cinematic components (excluding director and video_idea),
+        # stripping whitespace and dropping empty ones in a single pass
+        parts = [
+            part for part in (getattr(self, name).strip() for name in self.CINEMATIC_FIELDS)
+            if part
         ]
         
-        # Join components with commas, filtering out empty strings
-        prompt_string = ", ".join(filter(None, [c.strip() for c in components if c]))
-        
         # Return empty string if no components
-        if not prompt_string:
+        if not parts:
             return ""
+        
+        # Join components with commas
+        prompt_string = ", ".join(parts)
             
         # Capitalize first letter and add period
         return prompt_string[0].upper() + prompt_string[1:] + "."
 
+    def for_judging(self) -> "DirectorCutForJudging":
+        """
+        Returns the slim version of this cut that the judge actually needs.
+        
+        The judge only compares finished prompts, so sending it all seven
+        fields plus the (identical) video idea for every director just
+        wastes input tokens.
+        """
+        return DirectorCutForJudging(
+            director=self.director,
+            assembled_prompt=self.assemble_prompt()
+        )
+
     def pretty_print(self):
         """
         Displays the director's interpretation in a nice format.
@@ -177,6 +290,28 @@ class DirectorCut(BaseModel):
         print("--------------------------------")
 
 
+class DirectorCutForJudging(BaseModel):
+    """
+    ⚖️ PYDANTIC MODEL: What the Judge Sees
+    
+    A trimmed-down DirectorCut: just the director's name and their
+    assembled prompt. Fewer input tokens means a faster judge.
+    """
+    director: str = Field(..., description="The director of this interpretation.")
+    assembled_prompt: str = Field(..., description="The director's complete cinematic prompt.")
+
+
+class DirectorCutRequest(BaseModel):
+    """
+    📨 PYDANTIC MODEL: One Director Cut Waiting to Be Generated
+    
+    When several director cuts are generated in a single LLM call,
+    each one is described by a (video idea, director) pair like this.
+    """
+    video_idea: str = Field(..., description="The video idea to interpret.")
+    director: str = Field(..., description="The director whose style to use.")
+
+
 class ResultClass:
     """
     📦 SIMPLE DATA CONTAINER: Holds All Results
@@ -185,10 +320,68 @@ class ResultClass:
     We could use a Pydantic model here too, but since this is just
     for internal use (not LLM output), a simple class works fine.
     """
-    def __init__(self, additional_director, director_ideas, director_ranks):
+    def __init__(self, additional_director, director_ideas, director_ranks, pending_directors=()):
         self.additional_director = additional_director  # The AI-suggested director
         self.director_ideas = director_ideas            # List of all DirectorCut objects
         self.director_ranks = director_ranks            # Ranking results from the judge
+        self.pending_directors = pending_directors      # Directors still being generated
+
+    @property
+    def is_final(self) -> bool:
+        """True once the judge has ranked everything (streamed snapshots are partial)."""
+        return self.director_ranks is not None
+
+
+class DirectorCutCache:
+    """
+    💾 ON-DISK CACHE: Remember Director Cuts Between Runs
+    
+    Every DirectorCut costs a full LLM roundtrip (several seconds), but the
+    same (video idea, director) pair always asks the LLM the same question.
+    This cache stores each generated DirectorCut as JSON in a tiny SQLite
+    file, so repeat requests are answered with a fast local lookup instead.
+    
+    Pydantic makes this easy: model_dump_json() turns a DirectorCut into
+    a string, and model_validate_json() turns it back into a DirectorCut.
+    
+    A cut is only worth reusing if the same model, with the same prompts,
+    would write it again. So every key also includes the model name and,
+    once a compiled program is loaded, which compile it came from:
+    switching DSPY_MODEL or recompiling starts with a fresh set of cuts.
+    """
+    def __init__(self, path: str = DIRECTOR_CUT_CACHE_PATH, model: str = DSPY_MODEL):
+        self.path = path
+        self.namespace = model
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS director_cuts "
+                "(key TEXT PRIMARY KEY, director_cut TEXT NOT NULL)"
+            )
+
+    def mark_compiled(self, program_path: str):
+        """Keep cuts from this compiled program apart from any other prompts."""
+        self.namespace = f"{self.namespace}|{program_path}@{os.path.getmtime(program_path)}"
+
+    def make_key(self, video_idea: str, director: str) -> str:
+        """Hash the (model/program, video_idea, director) triple into a short, fixed-size key."""
+        return hashlib.blake2b(f"{self.namespace}|{video_idea}|{director}".encode()).hexdigest()
+
+    def get(self, video_idea: str, director: str) -> Optional[DirectorCut]:
+        """Return the cached DirectorCut, or None if we haven't generated it yet."""
+        with closing(sqlite3.connect(self.path)) as conn:
+            row = conn.execute(
+                "SELECT director_cut FROM director_cuts WHERE key = ?",
+                (self.make_key(video_idea, director),)
+            ).fetchone()
+        return DirectorCut.model_validate_json(row[0]) if row else None
+
+    def set(self, video_idea: str, director: str, director_cut: DirectorCut):
+        """Store a freshly generated DirectorCut for next time."""
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO director_cuts (key, director_cut) VALUES (?, ?)",
+                (self.make_key(video_idea, director), director_cut.model_dump_json())
+            )
 
 
 # ==========================================================================
@@ -234,7 +427,7 @@ class FindDirector(dspy.Signature):
     )
 
     # === OUTPUTS ===
-    additonal_director: str = dspy.OutputField(
+    additional_director: str = dspy.OutputField(
         desc="The best possible director based on the wanted video idea, that is not already in the provided director list."
     )
 
@@ -246,11 +439,14 @@ class GenerateDirectorCut(dspy.Signature):
     This is the core signature that transforms a simple video idea
     into a detailed cinematic prompt in the style of a specific director.
     
-    Notice how the output is a Pydantic model (DirectorCut).
-    DSPy will automatically ensure the LLM returns data in exactly
-    that structure, with all required fields filled out.
+    Notice how the outputs are seven plain string fields rather than
+    one Pydantic model. DSPy's default adapter writes these as compact
+    labelled sections, which costs fewer tokens than a JSON object,
+    and we assemble the DirectorCut ourselves in Python afterwards
+    (see DirectorCut.from_prediction).
     
-    This demonstrates DSPy's structured output capabilities.
+    The field descriptions are borrowed from DirectorCut, so the LLM
+    gets exactly the same guidance as before.
     """
     
     # === INPUTS ===
@@ -264,8 +460,49 @@ class GenerateDirectorCut(dspy.Signature):
     )
 
     # === OUTPUTS ===
-    director_cut: DirectorCut = dspy.OutputField(
-        desc="A structured object containing all seven deconstructed cinematic aspects."
+    subject_description: str = dspy.OutputField(
+        desc=DirectorCut.model_fields["subject_description"].description
+    )
+    action_description: str = dspy.OutputField(
+        desc=DirectorCut.model_fields["action_description"].description
+    )
+    setting_description: str = dspy.OutputField(
+        desc=DirectorCut.model_fields["setting_description"].description
+    )
+    cinematic_style: str = dspy.OutputField(
+        desc=DirectorCut.model_fields["cinematic_style"].description
+    )
+    shot_and_framing: str = dspy.OutputField(
+        desc=DirectorCut.model_fields["shot_and_framing"].description
+    )
+    camera_movement: str = dspy.OutputField(
+        desc=DirectorCut.model_fields["camera_movement"].description
+    )
+    lighting_and_color: str = dspy.OutputField(
+        desc=DirectorCut.model_fields["lighting_and_color"].description
+    )
+
+
+class GenerateDirectorCutBatch(dspy.Signature):
+    """
+    📚 SIGNATURE 2B: Generate Several Cinematic Interpretations at Once
+    
+    The batched version of GenerateDirectorCut. Instead of one LLM call
+    per director, a whole list of (video idea, director) requests goes
+    out in a single call and comes back as a list of DirectorCut objects.
+    
+    This demonstrates that DSPy signatures can take and return lists
+    of Pydantic models just as easily as single values.
+    """
+    
+    # === INPUTS ===
+    requests: List[DirectorCutRequest] = dspy.InputField(
+        desc="The video idea and director for each cinematic prompt to generate."
+    )
+
+    # === OUTPUTS ===
+    director_cuts: List[DirectorCut] = dspy.OutputField(
+        desc="One structured DirectorCut per request, in the same order as the requests."
     )
 
 
@@ -276,7 +513,7 @@ class DirectorJudge(dspy.Signature):
     This signature handles the complex task of comparing multiple
     creative interpretations and ranking them objectively.
     
-    Notice this takes a List[DirectorCut] as input and returns
+    Notice this takes a List[DirectorCutForJudging] as input and returns
     both rankings AND an explanation. This shows how DSPy can
     handle complex, multi-part outputs.
     
@@ -284,7 +521,7 @@ class DirectorJudge(dspy.Signature):
     """
     
     # === INPUTS ===
-    director_ideas: List[DirectorCut] = dspy.InputField(
+    director_ideas: List[DirectorCutForJudging] = dspy.InputField(
         desc="A list of director interpretations to be ranked"
     )
     
@@ -301,6 +538,160 @@ class DirectorJudge(dspy.Signature):
 # SECTION 4: DSPY MODULE (COMBINING SIGNATURES INTO WORKFLOWS)
 # ==========================================================================
 
+class BatchedDirectorCutGenerator(dspy.Module):
+    """
+    📦 DSPY MODULE: Micro-Batching for Director Cuts
+    
+    When many bake-offs run at the same time (e.g. several Gradio users),
+    each one asks for its own director cuts. This module collects those
+    requests for a few milliseconds and sends them to the LLM together,
+    so K users cost a handful of batched calls instead of K*N separate ones.
+    
+    Only requests from *different* bake-offs share a batch: each request
+    names its caller, and a batch never holds two from the same one. A
+    single bake-off's directors therefore go out as parallel single-cut
+    calls through the compact flat-field GenerateDirectorCut signature
+    (the path forward() and the optimizers exercise too); the batched
+    signature only comes into play when several users overlap.
+    
+    A batch is sent as soon as it holds `max_batch_size` requests, or after
+    `max_wait` seconds, whichever comes first. A batch of one simply uses
+    the regular single-cut predictor.
+    
+    Because this is a dspy.Module, its predictors are visible to DSPy's
+    optimizers just like the ones in DirectorBakeOff.
+    """
+    
+    def __init__(self, max_batch_size: int = 8, max_wait: float = 0.05):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        
+        # Predictors for a lone request and for a whole batch
+        # (extra keyword arguments to dspy.Predict are passed on to the LM,
+        # here a tighter output limit than the LM-wide default)
+        self.genDirectorCut = dspy.Predict(
+            GenerateDirectorCut, max_tokens=DIRECTOR_CUT_MAX_TOKENS
+        )
+        self.genDirectorCuts = dspy.Predict(
+            GenerateDirectorCutBatch, max_tokens=DIRECTOR_CUT_MAX_TOKENS * max_batch_size
+        )
+        
+        # Batches waiting to be sent, kept per event loop because futures
+        # can only be resolved on the loop that created them
+        self._pending = {}
+        self._flush_timers = {}
+        self._batch_tasks = set()
+
+    async def aforward(self, video_idea: str, director: str, caller: object = None):
+        """
+        Queue one director cut and wait for the batch it ends up in.
+        
+        `caller` identifies the bake-off asking (any object, compared by
+        identity); its requests are spread over separate batches.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        request = DirectorCutRequest(video_idea=video_idea, director=director)
+        
+        # Join the first open batch this caller isn't in yet, or start one
+        batches = self._pending.setdefault(loop, [])
+        batch = next(
+            (b for b in batches if caller is None or all(c is not caller for _, _, c in b)),
+            None
+        )
+        if batch is None:
+            batch = []
+            batches.append(batch)
+        batch.append((request, future, caller))
+        
+        # Send right away if the batch is full, otherwise start the timer
+        if len(batch) >= self.max_batch_size:
+            batches.remove(batch)
+            self._send(loop, batch)
+        elif loop not in self._flush_timers:
+            self._flush_timers[loop] = loop.call_later(self.max_wait, self._flush, loop)
+        
+        return await future
+
+    def _flush(self, loop):
+        """Send every batch queued on this loop (called by the timer)."""
+        self._flush_timers.pop(loop, None)
+        for batch in self._pending.pop(loop, []):
+            self._send(loop, batch)
+
+    def _send(self, loop, batch):
+        """Start the LLM call for one batch."""
+        # Keep a reference so the task isn't garbage collected mid-flight
+        task = loop.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+        
+        # If every caller stops waiting (e.g. their bake-offs were
+        # cancelled), nobody wants the answer any more: stop the LLM call
+        def cancel_if_abandoned(_):
+            if not task.done() and all(future.done() for _, future, _ in batch):
+                task.cancel()
+        for _, future, _ in batch:
+            future.add_done_callback(cancel_if_abandoned)
+
+    async def _run_batch(self, batch):
+        """
+        Run one LLM call for the whole batch and hand each caller its result.
+        
+        The call gets DIRECTOR_CUT_TIMEOUT seconds per cut it has to write,
+        so a batch of N isn't held to the budget of a single cut. A timeout
+        reaches every caller as an error, which their retry loop handles.
+        """
+        timeout = DIRECTOR_CUT_TIMEOUT * len(batch)
+        try:
+            if len(batch) == 1:
+                request, _, _ = batch[0]
+                result = await asyncio.wait_for(
+                    self.genDirectorCut.acall(
+                        video_idea=request.video_idea, director=request.director
+                    ),
+                    timeout=timeout
+                )
+                director_cuts = [
+                    DirectorCut.from_prediction(request.video_idea, request.director, result)
+                ]
+            else:
+                result = await asyncio.wait_for(
+                    self.genDirectorCuts.acall(requests=[request for request, _, _ in batch]),
+                    timeout=timeout
+                )
+                if len(result.director_cuts) != len(batch):
+                    raise ValueError(
+                        f"Expected {len(batch)} director cuts from the batch, got {len(result.director_cuts)}"
+                    )
+                # Trust our own request for who and what each cut is about,
+                # not the LLM's echo of it (just like DirectorCut.from_prediction)
+                director_cuts = [
+                    director_cut.model_copy(
+                        update={"director": request.director, "video_idea": request.video_idea}
+                    )
+                    for (request, _, _), director_cut in zip(batch, result.director_cuts)
+                ]
+        except Exception as e:
+            # Every caller in the batch sees the failure
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        # A cut written alongside other users' ideas depended on the whole
+        # prompt, not just its own (idea, director) - don't let the disk
+        # cache replay it to the next person who asks for that pair
+        cacheable = len(batch) == 1
+        for (_, future, _), director_cut in zip(batch, director_cuts):
+            if not future.done():
+                future.set_result(dspy.Prediction(director_cut=director_cut, cacheable=cacheable))
+
+
+# One shared batcher so concurrent bake-offs can share LLM calls
+director_cut_batcher = BatchedDirectorCutGenerator()
+
+
 class DirectorBakeOff(dspy.Module):
     """
     🏗️ DSPY MODULE: The Complete Workflow
@@ -322,33 +713,195 @@ class DirectorBakeOff(dspy.Module):
     4. Return the best result with explanations
     """
     
-    def __init__(self):
+    def __init__(self, explain: bool = True, use_cache: bool = True):
         """
         Initialize the module with three different DSPy predictors.
         
         Notice the different types:
         - dspy.Predict: Basic prediction (fast, direct)
         - dspy.ChainOfThought: Reasoning-enabled prediction (slower, more thoughtful)
+        
+        Args:
+            explain: When False, the judge only returns rankings (no reasoning
+                     or explanation), which is much faster when nobody reads them
+            use_cache: When False, every director cut is generated fresh
+                       (optimizers need to see the predictor actually run)
         """
+        self.explain = explain
+        
         # Basic predictor for finding additional director
         self.findDirector = dspy.Predict(FindDirector)
         
-        # Basic predictor for generating director cuts
-        self.genDirectorCut = dspy.Predict(GenerateDirectorCut)
+        # Batched generator for director cuts, shared by every bake-off
+        # so simultaneous requests are grouped into fewer LLM calls
+        self.genDirectorCut = director_cut_batcher
+        
+        # On-disk cache so we never pay twice for the same director cut
+        self.directorCutCache = DirectorCutCache() if use_cache else None
+        
+        if explain:
+            # Chain-of-thought predictor for complex ranking decisions
+            # This will make the LLM "think step by step" before ranking
+            self.directorJudge = dspy.ChainOfThought(DirectorJudge, max_tokens=JUDGE_MAX_TOKENS)
+        else:
+            # Rankings only: .delete() gives us the same signature without the
+            # explanation field, and Predict skips the reasoning step, so the
+            # LLM writes a handful of numbers instead of paragraphs of HTML
+            self.directorJudge = dspy.Predict(DirectorJudge.delete("explanation"))
+
+    @staticmethod
+    def _with_additional_director(directors: List[str], additional_director: str) -> List[str]:
+        """
+        Add the AI-suggested director to the list, unless it's already there.
+        
+        LLMs sometimes suggest a director the user already picked; comparing
+        case-insensitively avoids paying for the same interpretation twice.
+        """
+        if additional_director.strip().lower() in {d.lower() for d in directors}:
+            return list(directors)
+        return [*directors, additional_director]
+
+    async def _cached_gen(self, video_idea: str, director: str, caller: object = None):
+        """
+        Generate one director cut, checking the on-disk cache first.
+        
+        Cache hits are wrapped in a dspy.Prediction so callers can use
+        `.director_cut` exactly as they would on a fresh LLM result.
+        `caller` identifies the bake-off, so the batcher never groups
+        its directors together (see BatchedDirectorCutGenerator).
+        """
+        cache = self.directorCutCache
+        if cache is None:
+            return await self._gen_with_retry(video_idea, director, caller)
+        
+        # SQLite calls block, so they run on a worker thread: the event
+        # loop stays free for other bake-offs while we read the file
+        director_cut = await asyncio.to_thread(cache.get, video_idea, director)
+        if director_cut is not None:
+            return dspy.Prediction(director_cut=director_cut)
+        
+        # Cache miss: ask the LLM, then remember the answer (unless the
+        # batcher says it was shared with other bake-offs' requests)
+        result = await self._gen_with_retry(video_idea, director, caller)
+        if result.get("cacheable", True):
+            await asyncio.to_thread(cache.set, video_idea, director, result.director_cut)
+        return result
+
+    async def _gen_with_retry(self, video_idea: str, director: str, caller: object = None):
+        """
+        Ask the LLM for one director cut, with a timeout and retries.
         
-        # Chain-of-thought predictor for complex ranking decisions
-        # This will make the LLM "think step by step" before ranking
-        self.directorJudge = dspy.ChainOfThought(DirectorJudge)
+        One hung request would otherwise stall the whole bake-off, so the
+        batcher gives each LLM call DIRECTOR_CUT_TIMEOUT seconds per cut in
+        it. Timeouts and transport errors (like rate limits) are retried
+        here with exponential backoff: 1s, 2s, ... Any other error, like a
+        reply that doesn't parse, is raised straight away (see
+        RETRYABLE_ERRORS).
+        """
+        for attempt in range(DIRECTOR_CUT_ATTEMPTS):
+            try:
+                return await self.genDirectorCut.acall(
+                    video_idea=video_idea, director=director, caller=caller
+                )
+            except RETRYABLE_ERRORS as e:
+                if attempt == DIRECTOR_CUT_ATTEMPTS - 1:
+                    raise
+                print(f"   ⚠️ {director} attempt {attempt + 1} failed ({type(e).__name__}), retrying...")
+                await asyncio.sleep(2 ** attempt)
 
-    async def aforward(self, video_idea: str, directors: List[str] = ["Quentin Tarantino", "Alfred Hitchcock", "Richard Curtis"]):
+    def forward(self, video_idea: str, directors: List[str] = list(DEFAULT_DIRECTORS)):
+        """
+        🧵 SYNC FORWARD: The Same Workflow Without asyncio
+        
+        DSPy tools like dspy.Evaluate and the optimizers call programs
+        synchronously, so this gives them a version of the workflow with
+        no event loop involved. Instead of asyncio.gather, the director
+        cuts are generated with `.batch()`, which runs one predictor over
+        a list of dspy.Example inputs on a pool of threads.
+        
+        It prints nothing; use aforward() for the narrated version.
+        
+        Args:
+            video_idea: The user's video concept
+            directors: List of director names to compare
+            
+        Returns:
+            ResultClass: Complete results including rankings and explanations
+        """
+        additional_director = self.findDirector(
+            video_idea=video_idea, 
+            director_list=directors
+        ).additional_director
+        all_directors = self._with_additional_director(directors, additional_director)
+        
+        # Take what we can from the cache, and batch up the rest
+        cache = self.directorCutCache
+        director_cuts = {d: cache.get(video_idea, d) if cache else None for d in all_directors}
+        missing = [d for d, cut in director_cuts.items() if cut is None]
+        if missing:
+            examples = [
+                dspy.Example(video_idea=video_idea, director=d).with_inputs("video_idea", "director")
+                for d in missing
+            ]
+            # The batcher's single-cut predictor, one thread per director
+            # (without its tqdm progress bar, so this really prints nothing)
+            results = self.genDirectorCut.genDirectorCut.batch(
+                examples, num_threads=len(examples), disable_progress_bar=True
+            )
+            for director, result in zip(missing, results):
+                if result is None:
+                    raise RuntimeError(f"Failed to generate a director cut for {director}")
+                director_cuts[director] = DirectorCut.from_prediction(video_idea, director, result)
+                if cache:
+                    cache.set(video_idea, director, director_cuts[director])
+        
+        director_ideas = [dspy.Prediction(director_cut=director_cuts[d]) for d in all_directors]
+        director_ranks = self.directorJudge(
+            director_ideas=[idea.director_cut.for_judging() for idea in director_ideas]
+        )
+        
+        return ResultClass(
+            additional_director=additional_director,
+            director_ideas=director_ideas,
+            director_ranks=director_ranks
+        )
+
+    async def aforward(self, video_idea: str, directors: List[str] = list(DEFAULT_DIRECTORS)):
         """
         🚀 ASYNC FORWARD: The Main Workflow
         
         This is where the magic happens! This method orchestrates the entire
         director bake-off process using multiple LLM calls.
         
+        The steps themselves live in astream(), which reports progress as
+        it goes; aforward() simply runs it to the end and returns the
+        final, fully ranked result.
+        
+        Args:
+            video_idea: The user's video concept
+            directors: List of director names to compare
+            
+        Returns:
+            ResultClass: Complete results including rankings and explanations
+        """
+        result = None
+        async for result in self.astream(video_idea, directors):
+            pass
+        return result
+
+    async def astream(self, video_idea: str, directors: List[str] = list(DEFAULT_DIRECTORS)):
+        """
+        🌊 ASYNC STREAM: The Workflow, One Director at a Time
+        
+        An async generator version of the workflow. Once the extra director
+        is chosen, and again whenever director interpretations finish, it
+        yields a partial ResultClass (no rankings yet, `is_final` is False)
+        so a UI can show them straight away instead of waiting for the
+        slowest director and the judge.
+        The last thing it yields is the complete, ranked result.
+        
         Key DSPy concepts demonstrated:
-        1. Sequential LLM calls (find director first)
+        1. Overlapping LLM calls (find director while the user's directors generate)
         2. Parallel LLM calls (generate all director cuts simultaneously)
         3. Complex data flow between signatures
         4. Async processing for efficiency
@@ -357,8 +910,8 @@ class DirectorBakeOff(dspy.Module):
             video_idea: The user's video concept
             directors: List of director names to compare
             
-        Returns:
-            ResultClass: Complete results including rankings and explanations
+        Yields:
+            ResultClass: Partial results as directors finish, then the final one
         """
         
         # === STEP 1: Display user input ===
@@ -366,41 +919,97 @@ class DirectorBakeOff(dspy.Module):
         for director in directors:
             print(f"   - {director}")
 
-        # === STEP 2: Find additional director suggestion ===
-        print("\n🤖 Finding AI-suggested director...")
-        additional_director_result = self.findDirector(
-            video_idea=video_idea, 
-            director_list=directors
-        )
-        additional_director = additional_director_result.additonal_director
-        print(f"   ✨ DSPy Suggested Director: {additional_director}")
-
-        # === STEP 3: Generate director interpretations (IN PARALLEL!) ===
+        # === STEP 2: Start the user's directors AND find a suggestion (IN PARALLEL!) ===
+        # The user's directors don't depend on the AI suggestion, so there's
+        # no reason to wait for it: we kick off their interpretations right
+        # away and let them run while the LLM picks an additional director.
         print("\n⚡ Generating director interpretations in parallel...")
+        # A token for this run: the batcher keeps its cuts in separate LLM
+        # calls and only shares calls with *other* bake-offs
+        caller = object()
+        cut_tasks = [
+            asyncio.create_task(self._cached_gen(video_idea, director, caller))
+            for director in directors
+        ]
         
-        # Combine user directors + AI suggestion
-        all_directors = directors + [additional_director]
-        
-        # Use asyncio.gather to run multiple LLM calls simultaneously
-        # This is much faster than calling them one by one!
-        director_ideas = await asyncio.gather(
-            *[self.genDirectorCut.acall(video_idea=video_idea, director=director) 
-              for director in all_directors]
-        )
+        try:
+            print("\n🤖 Finding AI-suggested director...")
+            additional_director_result = await self.findDirector.acall(
+                video_idea=video_idea, 
+                director_list=directors
+            )
+            additional_director = additional_director_result.additional_director
+            print(f"   ✨ DSPy Suggested Director: {additional_director}")
+
+            # === STEP 3: Generate the suggested director's interpretation ===
+            # Only this one had to wait for the suggestion; it joins the
+            # user's directors that are already in flight. If the LLM just
+            # echoed one of the user's directors, that cut is already running.
+            all_directors = self._with_additional_director(directors, additional_director)
+            if len(all_directors) > len(directors):
+                cut_tasks.append(asyncio.create_task(self._cached_gen(video_idea, additional_director, caller)))
+            else:
+                print("   ↩️ Already in your list, so no extra interpretation needed")
+            
+            # The suggestion itself is news worth showing: hand over a first
+            # snapshot before any interpretation has finished
+            yield ResultClass(
+                additional_director=additional_director,
+                director_ideas=[],
+                director_ranks=None,
+                pending_directors=[
+                    director for director, task in zip(all_directors, cut_tasks)
+                    if not task.done()
+                ]
+            )
+            
+            # Use asyncio.wait to hand over interpretations the moment they're
+            # ready, rather than waiting silently for the slowest one. It
+            # returns *every* task that has finished, so cuts that land
+            # together (e.g. from one batched LLM call) go out as a single
+            # snapshot instead of several back-to-back ones.
+            # Directors we've already generated for this idea come from the cache
+            print("\n🎭 Generated Director Ideas:")
+            finished = []
+            pending = set(cut_tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in cut_tasks:
+                    if task in done:
+                        idea = task.result()
+                        idea.director_cut.pretty_print()
+                        finished.append(idea)
+                yield ResultClass(
+                    additional_director=additional_director,
+                    director_ideas=list(finished),
+                    director_ranks=None,
+                    pending_directors=[
+                        director for director, task in zip(all_directors, cut_tasks)
+                        if task in pending
+                    ]
+                )
+        except BaseException:
+            # If anything fails (or the caller stops listening), don't leave
+            # the other LLM calls running in the background: cancel whatever
+            # is still in flight
+            for task in cut_tasks:
+                task.cancel()
+            raise
         
-        # Display all generated ideas
-        print("\n🎭 Generated Director Ideas:")
-        for idea in director_ideas:
-            idea.director_cut.pretty_print()
+        # Every task is done now; collect the results in the original
+        # director order (asyncio.wait hands them over in finishing order)
+        director_ideas = [task.result() for task in cut_tasks]
 
         # === STEP 4: Judge and rank all interpretations ===
         print("\n⚖️ Judging and ranking director ideas...")
         
-        # Extract just the DirectorCut objects for judging
-        director_cuts = [idea.director_cut for idea in director_ideas]
+        # Give the judge just each director's name and finished prompt
+        director_cuts = [idea.director_cut.for_judging() for idea in director_ideas]
         
         # Use Chain-of-Thought for complex ranking decision
-        director_ranks = self.directorJudge(director_ideas=director_cuts)
+        # .acall() awaits the LLM without blocking the event loop, so other
+        # bake-offs sharing this process keep making progress meanwhile
+        director_ranks = await self.directorJudge.acall(director_ideas=director_cuts)
 
         # === STEP 5: Display rankings ===
         print("\n🏆 Director Rankings:")
@@ -408,19 +1017,22 @@ class DirectorBakeOff(dspy.Module):
             print(f"   Rank {rank}: {idea.director_cut.director}")
 
         # === STEP 6: Find and display the winner ===
-        best_rank = min(director_ranks.director_rankings)
-        best_index = director_ranks.director_rankings.index(best_rank)
+        # One pass over the rankings: pick the position with the lowest rank
+        # (on a tie, the earliest director in the list wins)
+        rankings = director_ranks.director_rankings
+        best_index = min(range(len(rankings)), key=rankings.__getitem__)
         best_idea = director_ideas[best_index]
         
         print("\n🥇 WINNER - Best Ranked Director Idea:")
         best_idea.director_cut.pretty_print()
         
-        print(f"\n💭 Judge's Reasoning:")
-        print(f"   {director_ranks.explanation}")
+        if self.explain:
+            print(f"\n💭 Judge's Reasoning:")
+            print(f"   {director_ranks.explanation}")
         print("=" * 50)
 
-        # === STEP 7: Return complete results ===
-        return ResultClass(
+        # === STEP 7: Hand over the complete results ===
+        yield ResultClass(
             additional_director=additional_director,
             director_ideas=director_ideas,
             director_ranks=director_ranks
@@ -431,25 +1043,66 @@ class DirectorBakeOff(dspy.Module):
 # SECTION 5: MAIN FUNCTIONS AND ENTRY POINT
 # ==========================================================================
 
-def run_bake_off(video_idea: str, directors: str = None) -> ResultClass:
+# The bake-off module is built once and shared by every request.
+# It holds no per-request state, so there's no need to rebuild its
+# predictors each time (the lock stops two threads building it at once).
+_bake_off = None
+_bake_off_lock = threading.Lock()
+
+
+def _get_bake_off() -> DirectorBakeOff:
+    """Return the shared DirectorBakeOff, creating it on first use."""
+    global _bake_off
+    if _bake_off is None:
+        with _bake_off_lock:
+            if _bake_off is None:
+                bake_off = DirectorBakeOff()
+                # Use the optimized prompts from compile_bake_off.py if we have them
+                if os.path.exists(COMPILED_PROGRAM_PATH):
+                    bake_off.load(COMPILED_PROGRAM_PATH)
+                    # Cuts written with the old prompts don't belong to it
+                    if bake_off.directorCutCache is not None:
+                        bake_off.directorCutCache.mark_compiled(COMPILED_PROGRAM_PATH)
+                    print(f"   📦 Loaded compiled program from {COMPILED_PROGRAM_PATH}")
+                _bake_off = bake_off
+    return _bake_off
+
+
+def parse_directors(directors: str) -> Tuple[str, ...]:
     """
-    🎯 MAIN FUNCTION: Easy-to-use interface for the Director Bake-Off
+    Turns a comma-separated string of director names into a clean tuple.
     
-    This function provides a simple interface that handles:
-    1. LLM setup and configuration
-    2. Input validation and parsing
-    3. Running the complete workflow
-    4. Error handling
+    Names are stripped, empty entries dropped, and repeats removed
+    (ignoring case) so the same director isn't generated twice.
+    A tuple is hashable, which makes it handy as a cache key.
+    """
+    seen = set()
+    names = []
+    # (the walrus := keeps each stripped name, so we only strip once)
+    for name in (n for d in directors.split(",") if (n := d.strip())):
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            names.append(name)
+    return tuple(names)
+
+
+async def run_bake_off_stream(video_idea: str, directors: Union[str, Sequence[str], None] = None):
+    """
+    🌊 STREAMING FUNCTION: The Bake-Off, Result by Result
     
-    This is the function that external code (like our Gradio interface)
-    calls to use our DSPy system.
+    Same setup as run_bake_off_async, but instead of one final answer it
+    yields a partial ResultClass each time a director's interpretation is
+    ready, then the complete ranked result (check `result.is_final`).
+    A web page can show the first director long before the last one and
+    the judge are done.
     
     Args:
         video_idea: A description of the video concept
-        directors: Comma-separated string of director names (optional)
+        directors: Comma-separated string of director names, or an
+                   already-parsed sequence of names (optional)
         
-    Returns:
-        ResultClass: Complete results from the bake-off
+    Yields:
+        ResultClass: Partial results, then the complete results
     """
     
     print("🚀 Running Director Bake-Off...")
@@ -461,23 +1114,79 @@ def run_bake_off(video_idea: str, directors: str = None) -> ResultClass:
         print(f"   ✅ DSPy configured with {provider} provider.")
     
     # === STEP 2: Parse and validate director input ===
-    if not (isinstance(directors, str) and directors.strip()):
+    if isinstance(directors, str):
+        # Parse comma-separated string (callers may also parse it themselves)
+        directors = parse_directors(directors)
+    if not directors:
         # Use default directors if none provided
-        directors = ["Quentin Tarantino", "Alfred Hitchcock", "Richard Curtis"]
+        directors = DEFAULT_DIRECTORS
         print("   📝 Using default directors")
-    else:
-        # Parse comma-separated string into list
-        directors = [d.strip() for d in directors.split(",") if d.strip()]
-        if not directors:
-            # Fallback to defaults if parsing failed
-            directors = ["Quentin Tarantino", "Alfred Hitchcock", "Richard Curtis"]
-            print("   📝 Parsing failed, using default directors")
-
-    # === STEP 3: Create and run the bake-off ===
-    bake_off = DirectorBakeOff()
-    result_class = asyncio.run(bake_off.aforward(video_idea=video_idea, directors=directors))
-    
-    return result_class
+    directors = list(directors)
+
+    # === STEP 3: Create (once) and run the bake-off ===
+    bake_off = _get_bake_off()
+    async for result in bake_off.astream(video_idea=video_idea, directors=directors):
+        yield result
+
+
+async def run_bake_off_async(video_idea: str, directors: Union[str, Sequence[str], None] = None) -> ResultClass:
+    """
+    🎯 MAIN FUNCTION: Easy-to-use interface for the Director Bake-Off
+    
+    This function provides a simple interface that handles:
+    1. LLM setup and configuration
+    2. Input validation and parsing
+    3. Running the complete workflow
+    4. Error handling
+    
+    This is the async version: servers that already run an event loop
+    (like our Gradio interface) can simply `await` it, with no extra
+    event loop created per request. It runs run_bake_off_stream to the
+    end and returns only the final result.
+    
+    Args:
+        video_idea: A description of the video concept
+        directors: Comma-separated string of director names, or an
+                   already-parsed sequence of names (optional)
+        
+    Returns:
+        ResultClass: Complete results from the bake-off
+    """
+    result = None
+    async for result in run_bake_off_stream(video_idea, directors):
+        pass
+    return result
+
+
+def run_bake_off(
+    video_idea: str, directors: Union[str, Sequence[str], None] = None
+) -> Union[ResultClass, "asyncio.Task[ResultClass]"]:
+    """
+    🎯 SYNC WRAPPER: Run the Director Bake-Off from regular (non-async) code
+    
+    Scripts and synchronous callers get a finished ResultClass, run on a
+    fresh event loop via asyncio.run().
+    
+    If an event loop is already running (e.g. inside a notebook or an
+    async server), asyncio.run() would fail, so instead the bake-off is
+    scheduled on that loop and the Task is returned for the caller to
+    await. Async code should prefer `await run_bake_off_async(...)`.
+    
+    Args:
+        video_idea: A description of the video concept
+        directors: Comma-separated string of director names, or an
+                   already-parsed sequence of names (optional)
+        
+    Returns:
+        ResultClass: Complete results from the bake-off
+        (or an asyncio.Task resolving to one, when a loop is already running)
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop running: the usual case for scripts
+        return asyncio.run(run_bake_off_async(video_idea, directors))
+    return loop.create_task(run_bake_off_async(video_idea, directors))
 
 
 # ==========================================================================
@@ -2,11 +2,18 @@
 
 import gradio as gr
 import asyncio
-from director_bake_off import run_bake_off
-import traceback
-
-# Clean, professional light mode styling
-LIGHT_MODE_CSS = """
+import json
+import os
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from html.parser import HTMLParser
+from jinja2 import Environment
+from markupsafe import Markup, escape
+
+# Clean, professional light mode styling (readable source; minified below)
+_RAW_LIGHT_MODE_CSS = """
 /* Force light mode and override system preferences */
 * {
     color-scheme: light !important;
@@ -31,8 +38,10 @@ LIGHT_MODE_CSS = """
     color: #1f2937 !important;
 }
 
-/* Header styling */
-.main-header {
+/* Header styling. The header and results are gr.HTML, which renders inside
+   .prose, and Gradio's ".prose *" color rule beats a bare class selector:
+   these rules are scoped under ".gradio-container .prose" to outrank it. */
+.gradio-container .prose .main-header {
     text-align: center;
     padding: 2rem 0;
     background: #ffffff;
@@ -40,51 +49,36 @@ LIGHT_MODE_CSS = """
     margin-bottom: 2rem;
 }
 
-.main-title {
+.gradio-container .prose .main-title {
     font-size: 2.25rem;
     font-weight: 700;
     color: #1f2937;
     margin-bottom: 0.5rem;
 }
 
-.main-subtitle {
+.gradio-container .prose .main-subtitle {
     font-size: 1.125rem;
     color: #6b7280;
     font-weight: 400;
 }
 
-/* Force light backgrounds for ALL input containers and elements */
-.gr-textbox, .gr-textarea, input, textarea,
-.gr-textbox *, .gr-textarea *,
-.gr-textbox > div, .gr-textarea > div,
-.gradio-textbox, .gradio-textarea {
+/* Text inputs: one canonical rule keeps every part of them light.
+   :where() adds no specificity, so the :focus rule below still applies */
+:where(.gradio-container) :is(.input-field, .gr-textbox, .gr-textarea, .gradio-textbox, .gradio-textarea, input, textarea),
+:where(.gradio-container) :is(.input-field, .gr-textbox, .gr-textarea) * {
     background: #ffffff !important;
-    background-color: #ffffff !important;
     color: #1f2937 !important;
-    border: 1px solid #d1d5db !important;
-    border-radius: 6px !important;
-}
-
-/* Force the container backgrounds to be light */
-.gr-textbox, .gr-textarea {
-    background: #ffffff !important;
-    background-color: #ffffff !important;
 }
 
-/* Force all child elements to have light backgrounds */
-.gr-textbox > *, .gr-textarea > *,
-.gr-textbox > div > *, .gr-textarea > div > * {
-    background: #ffffff !important;
-    background-color: #ffffff !important;
-    color: #1f2937 !important;
+.gr-textbox, .gr-textarea, .gradio-textbox, .gradio-textarea, input, textarea {
+    border: 1px solid #d1d5db !important;
+    border-radius: 6px !important;
 }
 
 .gr-textbox:focus, .gr-textarea:focus, input:focus, textarea:focus {
     border-color: #3b82f6 !important;
     box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1) !important;
     outline: none !important;
-    background: #ffffff !important;
-    background-color: #ffffff !important;
 }
 
 /* Button styling */
@@ -103,7 +97,7 @@ LIGHT_MODE_CSS = """
 }
 
 /* Results styling */
-.results-container {
+.gradio-container .prose .results-container {
     background: #ffffff;
     border: 1px solid #e5e7eb;
     border-radius: 8px;
@@ -111,7 +105,7 @@ LIGHT_MODE_CSS = """
     margin-top: 1.5rem;
 }
 
-.director-card {
+.gradio-container .prose .director-card {
     background: #f9fafb;
     border: 1px solid #e5e7eb;
     border-radius: 8px;
@@ -119,7 +113,7 @@ LIGHT_MODE_CSS = """
     margin-bottom: 1rem;
 }
 
-.rank-badge {
+.gradio-container .prose .rank-badge {
     display: inline-block;
     background: #3b82f6;
     color: #ffffff;
@@ -130,18 +124,18 @@ LIGHT_MODE_CSS = """
     margin-bottom: 0.5rem;
 }
 
-.rank-1 { background: #f59e0b; }
-.rank-2 { background: #6b7280; }
-.rank-3 { background: #d97706; }
+.gradio-container .prose .rank-1 { background: #f59e0b; }
+.gradio-container .prose .rank-2 { background: #6b7280; }
+.gradio-container .prose .rank-3 { background: #d97706; }
 
-.director-name {
+.gradio-container .prose .director-name {
     font-size: 1.25rem;
     font-weight: 600;
     color: #1f2937;
     margin-bottom: 1rem;
 }
 
-.prompt-text {
+.gradio-container .prose .prompt-text {
     background: #ffffff;
     color: #1f2937;
     padding: 1rem;
@@ -151,7 +145,7 @@ LIGHT_MODE_CSS = """
     margin-bottom: 1rem;
 }
 
-.additional-director {
+.gradio-container .prose .additional-director {
     background: #ecfdf5;
     border: 1px solid #d1fae5;
     border-radius: 8px;
@@ -159,7 +153,7 @@ LIGHT_MODE_CSS = """
     margin-bottom: 1.5rem;
 }
 
-.explanation-section {
+.gradio-container .prose .explanation-section {
     background: #f8fafc;
     border: 1px solid #e2e8f0;
     border-radius: 8px;
@@ -167,14 +161,14 @@ LIGHT_MODE_CSS = """
     margin-top: 1.5rem;
 }
 
-.section-title {
+.gradio-container .prose .section-title {
     font-size: 1.125rem;
     font-weight: 600;
     color: #1f2937;
     margin-bottom: 1rem;
 }
 
-.loading {
+.gradio-container .prose .loading {
     text-align: center;
     padding: 2rem;
     color: #6b7280;
@@ -186,196 +180,211 @@ LIGHT_MODE_CSS = """
     color: #1f2937 !important;
 }
 
-/* Override any remaining dark mode styles */
+/* Override any remaining dark mode styles. Gradio adds .dark to <body>
+   when the OS prefers dark and swaps its theme variables to dark values;
+   rules like ".prose *" read those variables directly, so inheriting a
+   color is not enough. Pin the variables back to their light values. */
 .dark, [data-theme="dark"] {
+    --body-background-fill: #ffffff !important;
+    --body-text-color: #1f2937 !important;
+    --body-text-color-subdued: #6b7280 !important;
+    --color-accent-soft: #eff6ff !important;
+    --background-fill-primary: #ffffff !important;
+    --background-fill-secondary: #f9fafb !important;
+    --border-color-accent: #93c5fd !important;
+    --border-color-primary: #e5e7eb !important;
+    --block-background-fill: #ffffff !important;
+    --block-info-text-color: #6b7280 !important;
+    --block-label-background-fill: #ffffff !important;
+    --block-label-text-color: #6b7280 !important;
+    --block-title-text-color: #6b7280 !important;
+    --input-background-fill: #ffffff !important;
+    --input-placeholder-color: #9ca3af !important;
+    --code-background-fill: #f3f4f6 !important;
     background: #ffffff !important;
     color: #1f2937 !important;
 }
 
-/* Force all text elements to be visible */
-h1, h2, h3, h4, h5, h6, p, div, span, li, ol, ul {
-    color: #1f2937 !important;
-}
-
-/* Ensure HTML content is visible */
-.gr-html * {
-    color: #1f2937 !important;
-}
-
-/* Force visibility for all text content */
-* {
-    color: #1f2937 !important;
-}
-
-/* Override Gradio's default text colors */
-.gradio-container * {
-    color: #1f2937 !important;
-}
-
-/* AGGRESSIVE LABEL VISIBILITY - Override all Gradio label styles */
-.gr-label, .gr-label *, label, .label,
-.gradio-textbox label, .gradio-textarea label,
-[data-testid*="textbox"] label, [data-testid*="textarea"] label,
-.gr-textbox .gr-label, .gr-textarea .gr-label,
-.gr-textbox span[data-testid*="label"], .gr-textarea span[data-testid*="label"],
-.gr-textbox .label, .gr-textarea .label,
-.gr-form .gr-label, .gr-block .gr-label,
-.gradio-container .gr-label, .gradio-container label,
-.gr-textbox > span, .gr-textarea > span,
-.gr-textbox > div > span, .gr-textarea > div > span,
-.gr-textbox .svelte-*, .gr-textarea .svelte-*,
-span[class*="label"], div[class*="label"],
-.gr-textbox span:first-child, .gr-textarea span:first-child {
-    color: #1f2937 !important;
-    font-weight: 600 !important;
-    font-size: 1rem !important;
-    margin-bottom: 0.5rem !important;
-    display: block !important;
-    opacity: 1 !important;
-    visibility: visible !important;
-    background: transparent !important;
-}
-
-/* Target Gradio's internal label structure more aggressively */
-.gr-textbox > div:first-child, .gr-textarea > div:first-child,
-.gr-textbox > div:first-child > *, .gr-textarea > div:first-child > *,
-.gr-textbox .svelte-1gfkn6j, .gr-textarea .svelte-1gfkn6j,
-.gr-textbox .svelte-*, .gr-textarea .svelte-* {
-    color: #1f2937 !important;
-    font-weight: 600 !important;
-    opacity: 1 !important;
-    visibility: visible !important;
-}
-
-/* Force all possible label selectors */
-.gradio-container [class*="label"],
-.gradio-container [data-testid*="label"],
-.gradio-container .gr-textbox *:first-child,
-.gradio-container .gr-textarea *:first-child {
-    color: #1f2937 !important;
-    font-weight: 600 !important;
-    opacity: 1 !important;
-    visibility: visible !important;
-}
-
-/* Nuclear option - force ALL text in textbox containers to be visible */
-.gr-textbox *, .gr-textarea * {
-    color: #1f2937 !important;
-    opacity: 1 !important;
-    visibility: visible !important;
-}
-
-/* NUCLEAR BACKGROUND OVERRIDE - Force all containers to be white */
-.gr-textbox, .gr-textarea, 
-.gr-textbox *, .gr-textarea *,
-.gr-textbox > div, .gr-textarea > div,
-.gr-textbox > div > div, .gr-textarea > div > div,
-.gr-textbox > div > div > div, .gr-textarea > div > div > div,
-[class*="textbox"], [class*="textarea"],
-[data-testid*="textbox"], [data-testid*="textarea"] {
-    background: #ffffff !important;
-    background-color: #ffffff !important;
-}
-
-/* Override any blue/dark backgrounds specifically */
-.gr-textbox [style*="background"], .gr-textarea [style*="background"],
-.gr-textbox [style*="background-color"], .gr-textarea [style*="background-color"] {
-    background: #ffffff !important;
-    background-color: #ffffff !important;
-}
-
-/* Force white background on any element with blue/dark styling */
-[style*="background: rgb("], [style*="background-color: rgb("],
-[style*="background:#"], [style*="background-color:#"] {
-    background: #ffffff !important;
-    background-color: #ffffff !important;
+/* Input labels: just our own fields' label text, bold and dark */
+.gradio-container .input-field [data-testid="block-info"] {
+    color: #1f2937;
+    font-weight: 600;
 }
 """
 
-def format_results_html(result):
-    """Format the results into clean, professional HTML."""
-    if not result:
-        return "<div class='loading'>No results to display.</div>"
+# Quoted strings in CSS (e.g. attribute selectors) must be left untouched
+_CSS_STRING = re.compile(r"""("[^"]*"|'[^']*')""")
+
+def _minify_css(src):
+    """Strip comments and redundant whitespace from a CSS string."""
+    src = re.sub(r"/\*.*?\*/", "", src, flags=re.S)
+    parts = _CSS_STRING.split(src)
+    # Even-numbered parts are plain CSS, odd-numbered ones are quoted strings
+    for i in range(0, len(parts), 2):
+        css = re.sub(r"\s+", " ", parts[i])
+        css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+        # Only trim *after* a colon: a space before one can be a descendant
+        # combinator (".a :is(.b)" is not the same as ".a:is(.b)")
+        parts[i] = re.sub(r":\s+", ":", css)
+    return "".join(parts).replace(";}", "}").strip()
+
+# Minified once at import, so every page load gets the small version
+LIGHT_MODE_CSS = _minify_css(_RAW_LIGHT_MODE_CSS)
+
+# Installs LIGHT_MODE_CSS as a constructable stylesheet via
+# document.adoptedStyleSheets: parsed once, no <style> node in the DOM.
+# Older browsers without constructable stylesheets get a plain <style> tag.
+LIGHT_MODE_CSS_HEAD = """
+<script>
+(function () {
+    const css = %s;
+    if ("adoptedStyleSheets" in document && "replaceSync" in CSSStyleSheet.prototype) {
+        const sheet = new CSSStyleSheet();
+        sheet.replaceSync(css);
+        document.adoptedStyleSheets = [...document.adoptedStyleSheets, sheet];
+    } else {
+        const style = document.createElement("style");
+        style.textContent = css;
+        document.head.appendChild(style);
+    }
+})();
+</script>
+""" % json.dumps(LIGHT_MODE_CSS).replace("</", "<\\/")
+
+# One Jinja environment for all page templates. autoescape=True HTML-escapes
+# every value as it's inserted, so LLM output can't inject markup.
+# trim_blocks/lstrip_blocks drop the lines the {% %} tags sit on, so the
+# rendered page carries no blank lines where the template logic was.
+_TEMPLATES = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
+
+class _ExplanationSanitizer(HTMLParser):
+    """Rebuilds LLM-written HTML keeping only a few bare formatting tags."""
+    # The tags DirectorJudge asks for; attributes are never kept
+    ALLOWED_TAGS = {"h4", "p", "br"}
+    # Elements whose content must not show up as text either
+    DROPPED_ELEMENTS = {"script", "style"}
     
-    try:
-        # Header with additional director suggestion
-        html = f"""
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._dropping = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.DROPPED_ELEMENTS:
+            self._dropping += 1
+        elif tag in self.ALLOWED_TAGS:
+            self.parts.append(f"<{tag}>")
+    
+    def handle_endtag(self, tag):
+        if tag in self.DROPPED_ELEMENTS:
+            self._dropping = max(self._dropping - 1, 0)
+        elif tag in self.ALLOWED_TAGS and tag != "br":
+            self.parts.append(f"</{tag}>")
+    
+    def handle_data(self, data):
+        if not self._dropping:
+            self.parts.append(escape(data))
+
+def sanitize_explanation(html):
+    """Keep the judge's <h4>/<p>/<br> formatting; escape or drop everything else."""
+    if not html:
+        return ""
+    sanitizer = _ExplanationSanitizer()
+    sanitizer.feed(str(html))
+    sanitizer.close()
+    return Markup("".join(sanitizer.parts))
+
+_TEMPLATES.filters["sanitize_explanation"] = sanitize_explanation
+
+# Results page markup, compiled by Jinja once at import; each request
+# only renders it with the bake-off result. The judge's explanation is
+# the one value that isn't escaped: it's asked to write HTML, so it goes
+# through sanitize_explanation instead, which keeps only <h4>, <p> and <br>
+# (results are cached and replayed to other users, so this matters).
+# The reasoning can run to several KB, so it starts collapsed: the browser
+# doesn't lay it out until someone opens it.
+# Partial results (streamed while directors finish) have no ranks yet,
+# so they skip the badges and the reasoning and list who's still working.
+RESULTS_TEMPLATE = _TEMPLATES.from_string("""
         <div class="results-container">
             <div class="additional-director">
                 <div class="section-title">🎬 AI Suggested Director</div>
                 <div style="font-size: 1.1rem; color: #1f2937;">
-                    <strong>{result.additional_director}</strong> - A perfect match for your vision!
+                    <strong>{{ result.additional_director }}</strong> - A perfect match for your vision!
                 </div>
             </div>
-        """
-        
-        # Director ideas with rankings
-        html += '<div class="section-title">🏆 Director Interpretations (Ranked)</div>'
-        
-        # Sort director ideas by ranking
-        ranked_ideas = []
-        for i, idea in enumerate(result.director_ideas):
-            rank = result.director_ranks.director_rankings[i]
-            ranked_ideas.append((rank, idea.director_cut))
-        
-        ranked_ideas.sort(key=lambda x: x[0])  # Sort by rank (1 is best)
-        
-        for rank, director_cut in ranked_ideas:
-            rank_class = f"rank-{min(rank, 3)}"  # Use rank-1, rank-2, rank-3 classes
-            
-            html += f"""
+        {% if result.is_final %}
+        <div class="section-title">🏆 Director Interpretations (Ranked)</div>
+        {% else %}
+        <div class="section-title">🎭 Director Interpretations (as they arrive)</div>
+        {% endif %}
+        {% for rank, idea in ranked_ideas %}
+        {% set director_cut = idea.director_cut %}
             <div class="director-card">
-                <div class="rank-badge {rank_class}">#{rank}</div>
-                <div class="director-name">{director_cut.director}</div>
-                <div class="prompt-text">{director_cut.assemble_prompt()}</div>
+                {% if rank %}<div class="rank-badge rank-{{ [rank, 3] | min }}">#{{ rank }}</div>{% endif %}
+                <div class="director-name">{{ director_cut.director }}</div>
+                <div class="prompt-text">{{ director_cut.assemble_prompt() }}</div>
                 
                 <details style="margin-top: 1rem;">
                     <summary style="cursor: pointer; font-weight: 500; color: #3b82f6;">
                         View Detailed Breakdown
                     </summary>
                     <div style="margin-top: 1rem; padding: 1rem; background: #f8fafc; border-radius: 6px; color: #1f2937;">
-                        <div style="margin-bottom: 0.8rem;"><strong>Subject:</strong> {director_cut.subject_description}</div>
-                        <div style="margin-bottom: 0.8rem;"><strong>Action:</strong> {director_cut.action_description}</div>
-                        <div style="margin-bottom: 0.8rem;"><strong>Setting:</strong> {director_cut.setting_description}</div>
-                        <div style="margin-bottom: 0.8rem;"><strong>Style:</strong> {director_cut.cinematic_style}</div>
-                        <div style="margin-bottom: 0.8rem;"><strong>Shot & Framing:</strong> {director_cut.shot_and_framing}</div>
-                        <div style="margin-bottom: 0.8rem;"><strong>Camera Movement:</strong> {director_cut.camera_movement}</div>
-                        <div style="margin-bottom: 0.8rem;"><strong>Lighting & Color:</strong> {director_cut.lighting_and_color}</div>
+                        <div style="margin-bottom: 0.8rem;"><strong>Subject:</strong> {{ director_cut.subject_description }}</div>
+                        <div style="margin-bottom: 0.8rem;"><strong>Action:</strong> {{ director_cut.action_description }}</div>
+                        <div style="margin-bottom: 0.8rem;"><strong>Setting:</strong> {{ director_cut.setting_description }}</div>
+                        <div style="margin-bottom: 0.8rem;"><strong>Style:</strong> {{ director_cut.cinematic_style }}</div>
+                        <div style="margin-bottom: 0.8rem;"><strong>Shot & Framing:</strong> {{ director_cut.shot_and_framing }}</div>
+                        <div style="margin-bottom: 0.8rem;"><strong>Camera Movement:</strong> {{ director_cut.camera_movement }}</div>
+                        <div style="margin-bottom: 0.8rem;"><strong>Lighting & Color:</strong> {{ director_cut.lighting_and_color }}</div>
                     </div>
                 </details>
             </div>
-            """
-        
-        # Explanation section with HTML formatting from DSPy
-        html += f"""
-            <div class="explanation-section">
-                <div class="section-title">🤔 Judge's Reasoning</div>
-                <div style="line-height: 1.8; color: #1f2937; font-size: 1rem;">
-                    {result.director_ranks.explanation}
+        {% endfor %}
+        {% if result.is_final %}
+            <details class="explanation-section">
+                <summary class="section-title" style="cursor: pointer; margin-bottom: 0;">🤔 Judge's Reasoning</summary>
+                <div style="line-height: 1.8; color: #1f2937; font-size: 1rem; margin-top: 1rem;">
+                    {{ result.director_ranks.explanation | sanitize_explanation }}
                 </div>
-            </div>
-        </div>
-        """
-        
-        return html
-        
-    except Exception as e:
-        return f"""
-        <div class="results-container">
-            <div style="color: #dc2626; padding: 1rem; background: #fef2f2; border-radius: 8px;">
-                <strong>Error formatting results:</strong> {str(e)}
-            </div>
+            </details>
+        {% elif result.pending_directors %}
+            <div class="loading">⏳ Still working on: {{ result.pending_directors | join(", ") }}</div>
+        {% else %}
+            <div class="loading">⚖️ All interpretations are in - the judge is ranking them...</div>
+        {% endif %}
         </div>
-        """
+""")
 
-def run_director_bakeoff(video_idea, directors):
-    """Run the director bake-off and return formatted results."""
-    if not video_idea or not video_idea.strip():
-        return "<div class='loading'>Please enter a video idea to get started!</div>"
+def format_results_html(result):
+    """Format the results into clean, professional HTML."""
+    if not result:
+        return NO_RESULTS_HTML
     
     try:
-        # Initial loading message with expectations
-        yield """
+        if not result.is_final:
+            # Not ranked yet: show the ideas in the order they finished
+            ranked_ideas = [(None, idea) for idea in result.director_ideas]
+        else:
+            # zip() would quietly drop directors the judge forgot to rank,
+            # so make sure every idea got exactly one rank first
+            rankings = result.director_ranks.director_rankings
+            if len(rankings) != len(result.director_ideas):
+                raise ValueError(
+                    f"The judge ranked {len(rankings)} of {len(result.director_ideas)} director ideas"
+                )
+            # Sort director ideas by ranking (1 is best). The key compares ranks
+            # only, so tied ranks keep their original order instead of falling
+            # back to comparing the (unorderable) ideas themselves.
+            ranked_ideas = sorted(zip(rankings, result.director_ideas), key=itemgetter(0))
+        return RESULTS_TEMPLATE.render(result=result, ranked_ideas=ranked_ideas)
+        
+    except Exception as e:
+        return ERROR_TEMPLATE.render(title="Error formatting results", error=str(e))
+
+# Loading message with expectations. It's shown in the browser the moment
+# the button is clicked (see create_interface), not sent from the server.
+LOADING_HTML = """
         <div class='loading' style='background: #f0f9ff; padding: 2rem; border-radius: 8px; border-left: 4px solid #3b82f6;'>
             <div style='font-size: 1.3rem; font-weight: 600; color: #1f2937; margin-bottom: 1rem;'>
                 🎬 Director Bake-Off in Progress...
@@ -396,51 +405,96 @@ def run_director_bakeoff(video_idea, directors):
             </div>
         </div>
         """
-        
-        # Run the bake-off
-        result = run_bake_off(video_idea, directors)
-        
-        # Format and return results
-        formatted_html = format_results_html(result)
-        yield formatted_html
-        
-    except Exception as e:
-        error_html = f"""
+
+@lru_cache(maxsize=None)
+def _bake_off_module():
+    """Import director_bake_off (and with it DSPy) on first use, not at startup."""
+    import director_bake_off
+    return director_bake_off
+
+# Shown when the bake-off, or rendering its results, fails. The template
+# escapes every value; title and the technical details are optional.
+ERROR_TEMPLATE = _TEMPLATES.from_string("""
         <div class="results-container">
             <div style="color: #e74c3c; padding: 1.5rem; background: #fdf2f2; border-radius: 8px; border-left: 4px solid #e74c3c;">
-                <div style="font-weight: 600; margin-bottom: 0.5rem;">Something went wrong!</div>
-                <div style="margin-bottom: 1rem;">{str(e)}</div>
+                <div style="font-weight: 600; margin-bottom: 0.5rem;">{{ title | default("Something went wrong!") }}</div>
+                <div style="margin-bottom: 1rem;">{{ error }}</div>
+                {% if details %}
                 <details>
                     <summary style="cursor: pointer; color: #c0392b;">View technical details</summary>
                     <pre style="margin-top: 1rem; font-size: 0.85rem; background: #f8f8f8; padding: 1rem; border-radius: 4px; overflow-x: auto;">
-{traceback.format_exc()}
+{{ details }}
                     </pre>
                 </details>
+                {% endif %}
             </div>
         </div>
-        """
-        yield error_html
-
-# Create the Gradio interface
-def create_interface():
-    # Force light mode theme
-    light_theme = gr.themes.Default(
-        primary_hue="blue",
-        secondary_hue="gray", 
-        neutral_hue="gray"
-    )
+""")
+
+# Fixed messages, sent as-is
+EMPTY_IDEA_HTML = "<div class='loading'>Please enter a video idea to get started!</div>"
+NO_RESULTS_HTML = "<div class='loading'>No results to display.</div>"
+
+# Most recent bake-off results, keyed on normalized inputs (oldest first)
+BAKE_OFF_CACHE_SIZE = 256
+_bake_off_results = OrderedDict()
+
+def _bake_off_key(video_idea, directors):
+    """Normalize the inputs so trivially different requests share a cache entry."""
+    return video_idea.strip().lower(), tuple(sorted(d.lower() for d in directors))
+
+async def cached_bake_off(video_idea, directors):
+    """Stream the bake-off, or replay the result of an identical recent request."""
+    key = _bake_off_key(video_idea, directors)
+    if key in _bake_off_results:
+        _bake_off_results.move_to_end(key)
+        yield _bake_off_results[key]
+        return
     
-    with gr.Blocks(css=LIGHT_MODE_CSS, theme=light_theme, title="Director Bake-Off Studio") as interface:
-        # Header
-        gr.HTML("""
+    async for result in _bake_off_module().run_bake_off_stream(video_idea, directors):
+        yield result
+    
+    # Only the final, ranked result is worth remembering
+    _bake_off_results[key] = result
+    if len(_bake_off_results) > BAKE_OFF_CACHE_SIZE:
+        _bake_off_results.popitem(last=False)
+
+# Deep LLM-client tracebacks can be many KB; the last few lines say what broke.
+# Only the innermost frames are formatted at all (source lines are looked
+# up just for those), and the text is capped as well.
+TRACEBACK_MAX_FRAMES = 10
+TRACEBACK_MAX_CHARS = 4096
+
+async def run_director_bakeoff(video_idea, directors):
+    """Run the director bake-off and yield formatted results."""
+    if not video_idea or not video_idea.strip():
+        yield EMPTY_IDEA_HTML
+        return
+    
+    try:
+        # Run the bake-off on Gradio's event loop, so other users'
+        # requests keep being served while we wait on the LLM, and
+        # re-render as each director finishes rather than only at the end
+        # (repeat requests are answered straight from the results cache)
+        async for result in cached_bake_off(video_idea, directors):
+            yield format_results_html(result)
+        
+    except Exception as e:
+        import traceback
+        # Keep only the end of the traceback (where the error actually is);
+        # the template escapes it so the <pre> holds plain text, not markup
+        details = traceback.format_exc(limit=-TRACEBACK_MAX_FRAMES)[-TRACEBACK_MAX_CHARS:]
+        yield ERROR_TEMPLATE.render(error=str(e), details=details)
+
+# Static page sections, defined once alongside the other page markup
+HEADER_HTML = """
         <div class="main-header">
             <h1 class="main-title">Director Bake-Off Studio</h1>
             <p class="main-subtitle">Let legendary directors compete to bring your vision to life</p>
         </div>
-        """)
-        
-        # How it Works section - moved to top
-        gr.HTML("""
+        """
+
+HOW_IT_WORKS_HTML = """
         <div style="background: #f0f9ff; padding: 1.5rem; border-radius: 8px; margin-bottom: 2rem; border-left: 4px solid #3b82f6;">
             <h3 style="margin-top: 0; color: #1f2937;">How it works:</h3>
             <ol style="color: #1f2937; line-height: 1.6;">
@@ -451,13 +505,38 @@ def create_interface():
                 <li>See them ranked by how well they match your concept!</li>
             </ol>
         </div>
-        """)
+        """
+
+FOOTER_HTML = """
+        <div style="text-align: center; padding: 2rem; color: #6b7280; font-size: 0.9rem;">
+            <p>Powered by DSPy and the creative genius of legendary directors 🎬</p>
+        </div>
+        """
+
+# Force light mode theme (built once; every interface shares it)
+LIGHT_THEME = gr.themes.Default(
+    primary_hue="blue",
+    secondary_hue="gray", 
+    neutral_hue="gray"
+)
+
+# Create the Gradio interface
+def create_interface():
+    # The stylesheet is installed by a script in <head> (see LIGHT_MODE_CSS_HEAD)
+    # rather than css=, which would inject it as a <style> block
+    with gr.Blocks(head=LIGHT_MODE_CSS_HEAD, theme=LIGHT_THEME, title="Director Bake-Off Studio") as interface:
+        # Header
+        gr.HTML(HEADER_HTML)
+        
+        # How it Works section - moved to top
+        gr.HTML(HOW_IT_WORKS_HTML)
         
-        # Results section - will only show content when there are actual results
+        # Results section - always mounted; while it's empty it takes no
+        # space (padding=False), so there's no visibility to toggle later
         results_html = gr.HTML(
             value="",
             elem_classes=["results-display"],
-            visible=False
+            padding=False
         )
         
         with gr.Row():
@@ -486,10 +565,21 @@ def create_interface():
                 )
                         
         # Set up the interaction - removed show_progress=True to eliminate progress bar
-        def handle_submit(video_idea, directors):
-            # Make results visible and update content
-            for result in run_director_bakeoff(video_idea, directors):
-                yield gr.update(value=result, visible=True)
+        async def handle_submit(video_idea, directors):
+            # The loader is already in place client-side; just send the
+            # content as it becomes ready. Parse the directors textbox once,
+            # here at the edge: everything downstream (including the results
+            # cache) gets a clean tuple
+            async for result in run_director_bakeoff(video_idea.strip(), _bake_off_module().parse_directors(directors or "")):
+                yield result
+        
+        # Show the loading message instantly in the browser: a JS-only
+        # listener (fn=None) needs no trip to the server at all
+        submit_btn.click(
+            fn=None,
+            js=f"() => {json.dumps(LOADING_HTML)}",
+            outputs=[results_html]
+        )
         
         submit_btn.click(
             fn=handle_submit,
@@ -498,21 +588,25 @@ def create_interface():
         )
         
         # Footer
-        gr.HTML("""
-        <div style="text-align: center; padding: 2rem; color: #6b7280; font-size: 0.9rem;">
-            <p>Powered by DSPy and the creative genius of legendary directors 🎬</p>
-        </div>
-        """)
+        gr.HTML(FOOTER_HTML)
     
     return interface
 
 if __name__ == "__main__":
     # Create and launch the interface
     interface = create_interface()
+    
+    # A bake-off takes 30-60s of LLM calls, but it's almost all waiting:
+    # the handlers are async and concurrent cuts are batched, so run up to
+    # 8 at once, let up to 64 more wait in line, and turn everyone else
+    # away with a clear message
+    interface.queue(default_concurrency_limit=8, max_size=64, api_open=False)
     interface.launch(
         server_name="0.0.0.0",
         server_port=7860,
         share=False,
         show_error=True,
-        debug=True
+        # Verbose debug logging is opt-in: set GRADIO_DEBUG=1 to turn it on
+        debug=os.getenv("GRADIO_DEBUG") == "1",
+        max_threads=16
     )